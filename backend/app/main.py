@@ -1,14 +1,26 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Iterator, List
 import os
-import psycopg2
+import asyncio
+import json
+import hashlib
+import orjson
 import logging
-from psycopg2.extras import RealDictCursor
+import redis
+import threading
+import multiprocessing
+from psycopg2.extensions import connection as PgConnection
+from psycopg2.extras import Json, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from dataclasses import dataclass
 from pokerkit import NoLimitTexasHoldem, Automation
-from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from itertools import chain
 from datetime import datetime
 
 
@@ -17,15 +29,47 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Redis client shared across requests for caching computed winnings
+redis_client = redis.Redis.from_url(
+    os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+    socket_connect_timeout=0.5,
+    socket_timeout=0.5,
+)
+WINNINGS_CACHE_TTL = 86400
+
+# Process pool for bulk winnings calculation, created in lifespan
+winnings_executor = None
+MAX_BULK_HANDS = 500
+
+
 # Lifespan event handler for FastAPI
 @asynccontextmanager
 async def lifespan(app):
+    global winnings_executor
+    hand_repository.open_pool()
     hand_repository.create_tables()
+    hand_writer.start()
+    if WINNINGS_WORKERS > 1:
+        # Spawned rather than forked so workers never share pooled connections
+        winnings_executor = ProcessPoolExecutor(
+            max_workers=WINNINGS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
     yield
+    if winnings_executor is not None:
+        winnings_executor.shutdown()
+        winnings_executor = None
+    await hand_writer.stop()
+    hand_repository.close_pool()
 
 
 # FastAPI app instance
-app = FastAPI(title="Poker Game API", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Poker Game API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 
 # CORS middleware
@@ -45,13 +89,17 @@ class HandRecord:
     dealer_position: int
     small_blind_position: int
     big_blind_position: int
-    player_hands: str
-    action_sequence: str
-    winnings: str
-    created_at: str
+    player_hands: List[str]
+    action_sequence: List[str]
+    winnings: List[int]
+    created_at: datetime
 
 
 class HandRequest(BaseModel):
+    # Extra fields are ignored, not forbidden: the frontend also posts
+    # display-only fields such as totalPot and summary
+    model_config = ConfigDict(frozen=True)
+
     id: str
     stackSize: int
     dealerPosition: int
@@ -62,6 +110,59 @@ class HandRequest(BaseModel):
     winnings: str
 
 
+class BlockingConnectionPool(ThreadedConnectionPool):
+    """ThreadedConnectionPool that waits for a free connection instead of
+    raising PoolError once every connection is checked out."""
+
+    def __init__(self, minconn, maxconn, *args, **kwargs):
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self._slots = threading.BoundedSemaphore(maxconn)
+
+    def getconn(self, key=None):
+        self._slots.acquire()
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+
+class HandConnection(PgConnection):
+    # Set once the hand statements are prepared on this session
+    statements_prepared = False
+
+
+# uvicorn reads WEB_CONCURRENCY too, so every worker knows how many share
+# the database's connection limit (postgres allows 100 by default). Unset
+# means a single process, as with a plain `uvicorn app.main:app`
+WORKERS = int(os.getenv("WEB_CONCURRENCY", "1"))
+# Bulk winnings processes share the cores left over by the uvicorn workers;
+# with one or fewer per worker, bulk hands are computed in a thread instead
+WINNINGS_WORKERS = max(1, (os.cpu_count() or 1) // WORKERS)
+DB_CONNECTION_BUDGET = int(os.getenv("DB_CONNECTION_BUDGET", "80"))
+# Every worker needs at least one insert and one stream connection
+if WORKERS * 2 > DB_CONNECTION_BUDGET:
+    logger.warning(
+        f"{WORKERS} workers need at least {WORKERS * 2} database connections, "
+        f"more than DB_CONNECTION_BUDGET={DB_CONNECTION_BUDGET}"
+    )
+_worker_connections = max(2, DB_CONNECTION_BUDGET // WORKERS)
+# History streams hold their connection while writing to the client, so
+# they get their own pool and cannot starve inserts
+DB_STREAM_POOL_SIZE = max(1, min(4, _worker_connections // 5))
+DB_POOL_SIZE = max(1, min(20, _worker_connections - DB_STREAM_POOL_SIZE))
+
+
+# Arbitrary key for the advisory lock held during schema setup
+SCHEMA_LOCK_ID = 727501
+
+
 class HandRepository:
     def __init__(self):
         # Use DATABASE_URL if set, else auto-detect test environment
@@ -85,20 +186,77 @@ class HandRepository:
                 self.connection_string = (
                     "postgresql://postgres:password@db:5432/poker_db"
                 )
-
-    def get_connection(self):
+        self.pool = None
+        self.stream_pool = None
+        self._pool_lock = threading.Lock()
+
+    def open_pool(self):
+        with self._pool_lock:
+            if self.pool is None:
+                stream_pool = None
+                try:
+                    stream_pool = BlockingConnectionPool(
+                        minconn=DB_STREAM_POOL_SIZE,
+                        maxconn=DB_STREAM_POOL_SIZE,
+                        dsn=self.connection_string,
+                        connection_factory=HandConnection,
+                    )
+                    # minconn == maxconn so returned connections stay open
+                    # instead of being closed once two are idle
+                    pool = BlockingConnectionPool(
+                        minconn=DB_POOL_SIZE,
+                        maxconn=DB_POOL_SIZE,
+                        dsn=self.connection_string,
+                        connection_factory=HandConnection,
+                    )
+                except Exception as e:
+                    if stream_pool is not None:
+                        stream_pool.closeall()
+                    logger.error(f"Database connection error: {e}")
+                    raise
+                # self.pool is assigned last since get_connection checks it
+                self.stream_pool = stream_pool
+                self.pool = pool
+
+    def close_pool(self):
+        with self._pool_lock:
+            if self.pool is not None:
+                self.pool.closeall()
+                self.pool = None
+            if self.stream_pool is not None:
+                self.stream_pool.closeall()
+                self.stream_pool = None
+
+    @contextmanager
+    def get_connection(self, stream=False):
+        # Pool is normally opened in lifespan; open lazily otherwise
+        if self.pool is None:
+            self.open_pool()
+        pool = self.stream_pool if stream else self.pool
         try:
-            return psycopg2.connect(
-                self.connection_string, cursor_factory=RealDictCursor
-            )
+            conn = pool.getconn()
         except Exception as e:
             logger.error(f"Database connection error: {e}")
             raise
+        try:
+            yield conn
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            pool.putconn(conn)
 
     def create_tables(self):
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
+                    # Every worker runs this on startup; concurrent
+                    # CREATE TABLE IF NOT EXISTS can still collide, so
+                    # serialize the schema setup until this commit
+                    cur.execute(
+                        "SELECT pg_advisory_xact_lock(%s)", (SCHEMA_LOCK_ID,)
+                    )
                     cur.execute(
                         """
                         CREATE TABLE IF NOT EXISTS hands (
@@ -107,63 +265,268 @@ class HandRepository:
                             dealer_position INTEGER NOT NULL,
                             small_blind_position INTEGER NOT NULL,
                             big_blind_position INTEGER NOT NULL,
-                            player_hands TEXT NOT NULL,
-                            action_sequence TEXT NOT NULL,
-                            winnings TEXT NOT NULL,
+                            player_hands JSONB NOT NULL,
+                            action_sequence JSONB NOT NULL,
+                            winnings JSONB NOT NULL,
                             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                         )
                         """
                     )
+                    # Convert tables created when these columns were TEXT
+                    cur.execute(
+                        r"""
+                        DO $$
+                        BEGIN
+                            IF (SELECT data_type FROM information_schema.columns
+                                WHERE table_schema = current_schema()
+                                AND table_name = 'hands'
+                                AND column_name = 'player_hands') = 'text' THEN
+                                ALTER TABLE hands
+                                    ALTER COLUMN player_hands TYPE JSONB USING (
+                                        '[' || rtrim(regexp_replace(
+                                            player_hands,
+                                            '[^:;]*:\s*([^;]*[^;\s])\s*;?',
+                                            '"\1",', 'g'), ',') || ']'
+                                    )::jsonb,
+                                    ALTER COLUMN action_sequence TYPE JSONB USING
+                                        to_jsonb(array_remove(
+                                            string_to_array(action_sequence, '.'),
+                                            ''));
+                            END IF;
+                            IF (SELECT data_type FROM information_schema.columns
+                                WHERE table_schema = current_schema()
+                                AND table_name = 'hands'
+                                AND column_name = 'winnings') = 'text' THEN
+                                ALTER TABLE hands
+                                    ALTER COLUMN winnings TYPE JSONB USING (
+                                        '[' || rtrim(regexp_replace(
+                                            winnings,
+                                            '[^:;]*:\s*\+?(-?\d+)[^;]*;?',
+                                            '\1,', 'g'), ',') || ']'
+                                    )::jsonb;
+                            END IF;
+                        END $$
+                        """
+                    )
+                    cur.execute(
+                        """
+                        CREATE INDEX IF NOT EXISTS hands_created_at_desc_idx
+                        ON hands (created_at DESC)
+                        INCLUDE (
+                            id, stack_size, dealer_position,
+                            small_blind_position, big_blind_position)
+                        """
+                    )
                     conn.commit()
         except Exception as e:
             logger.error(f"Error creating tables: {e}")
             raise
 
     def save_hand(self, hand: HandRecord) -> HandRecord:
+        return self.save_hands([hand])[0]
+
+    def prepare_statements(self, cur):
+        # Prepared lazily since the table may not exist when the pool opens
+        if cur.connection.statements_prepared:
+            return
+        cur.execute(
+            """
+            PREPARE hands_ins (
+                varchar, integer, integer, integer, integer,
+                jsonb, jsonb, jsonb, timestamp) AS
+            INSERT INTO hands (
+                id, stack_size, dealer_position,
+                small_blind_position, big_blind_position,
+                player_hands, action_sequence, winnings,
+                created_at)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+            """
+        )
+        cur.connection.statements_prepared = True
+
+    def save_hands(self, hands: List[HandRecord]) -> List[HandRecord]:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        INSERT INTO hands (
-                            id, stack_size, dealer_position,
-                            small_blind_position, big_blind_position,
-                            player_hands, action_sequence, winnings,
-                            created_at)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """,
+                    # Hand history is not critical enough to wait on WAL flush
+                    cur.execute("SET LOCAL synchronous_commit = OFF")
+                    rows = [
                         (
                             hand.id,
                             hand.stack_size,
                             hand.dealer_position,
                             hand.small_blind_position,
                             hand.big_blind_position,
-                            hand.player_hands,
-                            hand.action_sequence,
-                            hand.winnings,
+                            Json(hand.player_hands),
+                            Json(hand.action_sequence),
+                            Json(hand.winnings),
                             hand.created_at,
-                        ),
-                    )
+                        )
+                        for hand in hands
+                    ]
+                    if len(rows) == 1:
+                        # Lone hands are the common case at low load
+                        self.prepare_statements(cur)
+                        cur.execute(
+                            "EXECUTE hands_ins "
+                            "(%s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                            rows[0],
+                        )
+                    else:
+                        execute_values(
+                            cur,
+                            """
+                            INSERT INTO hands (
+                                id, stack_size, dealer_position,
+                                small_blind_position, big_blind_position,
+                                player_hands, action_sequence, winnings,
+                                created_at)
+                            VALUES %s
+                            """,
+                            rows,
+                            page_size=200,
+                        )
                     conn.commit()
-            return hand
+            return hands
         except Exception as e:
-            logger.error(f"Error saving hand: {e}")
+            logger.error(f"Error saving hands: {e}")
             raise
 
-    def get_all_hands(self) -> List[HandRecord]:
+    def get_hands_version(self):
+        # Hands are insert-only, so count and newest timestamp identify a listing
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("SELECT * FROM hands ORDER BY created_at DESC")
-                    rows = cur.fetchall()
-                    return [HandRecord(**row) for row in rows]
+                    cur.execute("SELECT count(*), max(created_at) FROM hands")
+                    return cur.fetchone()
+        except Exception as e:
+            logger.error(f"Error fetching hands version: {e}")
+            raise
+
+    def get_all_hands(self) -> Iterator[dict]:
+        try:
+            with self.get_connection(stream=True) as conn:
+                # Server-side cursor keeps memory flat regardless of table size
+                with conn.cursor(name="hands_cur") as cur:
+                    cur.itersize = 1000
+                    cur.execute(
+                        """
+                        SELECT id, stack_size, dealer_position,
+                            small_blind_position, big_blind_position,
+                            player_hands, action_sequence, winnings,
+                            created_at
+                        FROM hands ORDER BY created_at DESC
+                        """
+                    )
+                    for (
+                        id_,
+                        stack_size,
+                        dealer_position,
+                        small_blind_position,
+                        big_blind_position,
+                        player_hands,
+                        action_sequence,
+                        winnings,
+                        created_at,
+                    ) in cur:
+                        yield {
+                            "id": id_,
+                            "stackSize": stack_size,
+                            "dealerPosition": dealer_position,
+                            "smallBlindPosition": small_blind_position,
+                            "bigBlindPosition": big_blind_position,
+                            "playerHands": player_hands,
+                            "actionSequence": action_sequence,
+                            "winnings": winnings,
+                            "createdAt": created_at,
+                        }
         except Exception as e:
             logger.error(f"Error fetching hands: {e}")
             raise
 
 
+class HandWriter:
+    """Coalesces concurrently submitted hands into multi-row inserts."""
+
+    def __init__(self, repository: HandRepository, max_batch_size: int = 256):
+        self.repository = repository
+        self.max_batch_size = max_batch_size
+        self.queue = None
+        self.task = None
+
+    def start(self):
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        if self.task is None:
+            return
+        # Let already queued hands reach the database before shutting down
+        await self.queue.join()
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.task = None
+        self.queue = None
+
+    async def submit(self, hand: HandRecord) -> HandRecord:
+        if self.task is None:
+            return await asyncio.to_thread(self.repository.save_hand, hand)
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((hand, future))
+        # Resolved by the flusher once the hand is committed
+        return await future
+
+    async def _flush_loop(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def _flush(self, batch):
+        try:
+            await asyncio.to_thread(
+                self.repository.save_hands, [hand for hand, _ in batch]
+            )
+        except Exception as e:
+            if len(batch) == 1:
+                self._resolve(batch[0][1], exception=e)
+                return
+            # Retry one by one so a single bad hand does not fail the batch
+            for hand, future in batch:
+                try:
+                    await asyncio.to_thread(self.repository.save_hand, hand)
+                    self._resolve(future, result=hand)
+                except Exception as e:
+                    self._resolve(future, exception=e)
+            return
+        for hand, future in batch:
+            self._resolve(future, result=hand)
+
+    @staticmethod
+    def _resolve(future, result=None, exception=None):
+        # The request awaiting this future may have been cancelled
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
 # Initialize repository
 hand_repository = HandRepository()
+hand_writer = HandWriter(hand_repository)
 
 
 @app.get("/")
@@ -171,30 +534,59 @@ async def root():
     return {"message": "Poker Game API"}
 
 
-@app.get("/api/hands", response_model=List[dict])
-async def get_hands():
+def json_array_chunks(items, chunk_size=1000):
+    # Encode items as one JSON array, flushed every chunk_size items
+    chunk = [b"["]
+    for i, item in enumerate(items):
+        if i:
+            chunk.append(b",")
+        chunk.append(orjson.dumps(item))
+        if i % chunk_size == chunk_size - 1:
+            yield b"".join(chunk)
+            chunk = []
+    chunk.append(b"]")
+    yield b"".join(chunk)
+
+
+@app.get("/api/hands")
+async def get_hands(request: Request):
     try:
+        count, latest = await asyncio.to_thread(hand_repository.get_hands_version)
+        etag = f'W/"{count}-{latest.timestamp() if latest else 0}"'
+        # Revalidated on every poll, so a freshly saved hand shows up at once
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
         hands = hand_repository.get_all_hands()
-        return [
-            {
-                "id": hand.id,
-                "stackSize": hand.stack_size,
-                "dealerPosition": hand.dealer_position,
-                "smallBlindPosition": hand.small_blind_position,
-                "bigBlindPosition": hand.big_blind_position,
-                "playerHands": hand.player_hands,
-                "actionSequence": hand.action_sequence,
-                "winnings": hand.winnings,
-                "createdAt": hand.created_at,
-            }
-            for hand in hands
-        ]
+        # Run the query up front so database errors still map to a 500
+        first = await asyncio.to_thread(next, hands, None)
     except Exception as e:
         logger.error(f"/api/hands error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    rows = [] if first is None else chain((first,), hands)
+    return StreamingResponse(
+        json_array_chunks(rows), media_type="application/json", headers=headers
+    )
+
+
+# Exact action tokens; bets and raises carry an amount instead, e.g. 'r300'
+FOLD, CHECK_OR_CALL = range(2)
+ACTION_KINDS = {
+    "f": FOLD,
+    "x": CHECK_OR_CALL,
+    "c": CHECK_OR_CALL,
+    # Not directly supported; treat as bet/raise to player's stack
+    # This may need to be improved for edge cases
+    "allin": CHECK_OR_CALL,
+}
+# Board cards come in tokens of 3-5 cards, e.g. '3hKdQs'
+BOARD_TOKEN_LENGTHS = frozenset((6, 8, 10))
 
 
 def parse_player_hands(player_hands_str):
+    # Every "Player N: AhKh" entry must unpack, so a malformed entry raises
+    # instead of shifting later players' cards into its seat
     hands = []
     for part in player_hands_str.split(";"):
         part = part.strip()
@@ -210,54 +602,103 @@ def parse_action_sequence(action_sequence_str):
     return [a for a in action_sequence_str.split(".") if a]
 
 
-def calculate_winnings_with_pokerkit(stack_size, player_hands_str, action_sequence_str):
-    player_hands = parse_player_hands(player_hands_str)
-    actions = parse_action_sequence(action_sequence_str)
-    stacks = [stack_size] * 6
-
-    # Use Automation enum values, not strings, for automations tuple
-    automations: tuple[Automation, ...] = (
-        Automation.ANTE_POSTING,
-        Automation.BET_COLLECTION,
-        Automation.BLIND_OR_STRADDLE_POSTING,
-        Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
-        Automation.HAND_KILLING,
-        Automation.CHIPS_PUSHING,
-        Automation.CHIPS_PULLING,
+RANK_CODES = {rank: i for i, rank in enumerate("23456789TJQKA")}
+SUIT_CODES = {suit: i for i, suit in enumerate("cdhs")}
+
+
+def encode_card(card):
+    # 4 bits of rank followed by 2 bits of suit, e.g. 'Ah' -> 50
+    return RANK_CODES[card[0]] << 2 | SUIT_CODES[card[1]]
+
+
+def pack_hand(cards):
+    # Two 6-bit cards in 12 bits, e.g. 'AhKh'
+    if len(cards) != 4:
+        raise ValueError(f"Invalid hole cards: {cards}")
+    try:
+        return encode_card(cards[:2]) | encode_card(cards[2:]) << 6
+    except KeyError:
+        raise ValueError(f"Invalid hole cards: {cards}") from None
+
+
+def winnings_cache_key(stack_size, player_hands, actions):
+    # Hole cards are hashed as fixed-width packed ints rather than text
+    packed = [
+        pack_hand("".join(cards.split())).to_bytes(2, "little")
+        for cards in player_hands
+    ]
+    data = b"".join(
+        [
+            f"{stack_size}|{len(player_hands)}|".encode(),
+            *packed,
+            ".".join(actions).encode(),
+        ]
     )
-    state = NoLimitTexasHoldem.create_state(
-        automations,
+    return "pk:" + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def calculate_winnings_with_pokerkit(stack_size, player_hands, actions):
+    # Payoffs are a pure function of the inputs, so they can be cached
+    key = winnings_cache_key(stack_size, player_hands, actions)
+    try:
+        cached = redis_client.get(key)
+        if cached is not None:
+            return json.loads(cached)
+    except redis.exceptions.RedisError as e:
+        logger.warning(f"Redis unavailable, computing winnings directly: {e}")
+        return compute_winnings(stack_size, player_hands, actions)
+
+    payoffs = compute_winnings(stack_size, player_hands, actions)
+    try:
+        redis_client.setex(key, WINNINGS_CACHE_TTL, json.dumps(payoffs))
+    except redis.exceptions.RedisError as e:
+        logger.warning(f"Error caching winnings: {e}")
+    return payoffs
+
+
+# Use Automation enum values, not strings, for automations tuple
+AUTOMATIONS: tuple[Automation, ...] = (
+    Automation.ANTE_POSTING,
+    Automation.BET_COLLECTION,
+    Automation.BLIND_OR_STRADDLE_POSTING,
+    Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+    Automation.HAND_KILLING,
+    Automation.CHIPS_PUSHING,
+    Automation.CHIPS_PULLING,
+)
+
+
+@lru_cache(maxsize=64)
+def state_args(stack_size):
+    # Stack size is the only variable input to state construction
+    return (
+        AUTOMATIONS,
         False,  # Uniform antes?
         0,  # Antes
         (20, 40),  # Blinds
         40,  # Min-bet
-        tuple(stacks),
+        (stack_size,) * 6,
         6,
     )
 
+
+def compute_winnings(stack_size, player_hands, actions):
+    state = NoLimitTexasHoldem.create_state(*state_args(stack_size))
+
     # Deal hole cards
     for hand in player_hands:
         state.deal_hole(hand)
 
     # Replay actions (with burn card before each board card)
     for action in actions:
-        if action == "f":
+        kind = ACTION_KINDS.get(action)
+        if kind == FOLD:
             state.fold()
-        elif action == "x":
-            state.check_or_call()
-        elif action == "c":
+        elif kind == CHECK_OR_CALL:
             state.check_or_call()
-        elif action.startswith("b"):
-            amount = int(action[1:])
-            state.complete_bet_or_raise_to(amount)
-        elif action.startswith("r"):
-            amount = int(action[1:])
-            state.complete_bet_or_raise_to(amount)
-        elif action == "allin":
-            # Not directly supported; treat as bet/raise to player's stack
-            # This may need to be improved for edge cases
-            state.check_or_call()
-        elif len(action) in [6, 8, 10]:  # Board cards, e.g. '3hKdQs'
+        elif action[0] in "br":
+            state.complete_bet_or_raise_to(int(action[1:]))
+        elif len(action) in BOARD_TOKEN_LENGTHS:
             state.burn_card()
             state.deal_board(action)
         # Add more parsing as needed
@@ -266,49 +707,159 @@ def calculate_winnings_with_pokerkit(stack_size, player_hands_str, action_sequen
     return list(state.payoffs)
 
 
-@app.post("/api/hands", response_model=dict)
+def hand_response(hand_request: HandRequest, hand_record: HandRecord) -> dict:
+    # Request fields already use the response's camelCase names
+    return hand_request.model_dump() | {
+        "playerHands": hand_record.player_hands,
+        "actionSequence": hand_record.action_sequence,
+        "winnings": hand_record.winnings,
+        "createdAt": hand_record.created_at,
+    }
+
+
+@app.post("/api/hands")
 async def create_hand(hand_request: HandRequest):
     try:
-        winnings_list = calculate_winnings_with_pokerkit(
+        # Parsed once here; the lists are what gets stored and returned,
+        # and formatting for display is left to the client
+        player_hands = parse_player_hands(hand_request.playerHands)
+        actions = parse_action_sequence(hand_request.actionSequence)
+
+        # Redis lookups and pokerkit replay both block; keep them off the loop
+        winnings_list = await asyncio.to_thread(
+            calculate_winnings_with_pokerkit,
             hand_request.stackSize,
-            hand_request.playerHands,
-            hand_request.actionSequence,
+            player_hands,
+            actions,
         )
-        winnings_str = "; ".join(
-            [f"Player {i+1}: {w:+d}" for i, w in enumerate(winnings_list)]
-        )
-
+        created_at = datetime.now()
         hand_record = HandRecord(
             id=hand_request.id,
             stack_size=hand_request.stackSize,
             dealer_position=hand_request.dealerPosition,
             small_blind_position=hand_request.smallBlindPosition,
             big_blind_position=hand_request.bigBlindPosition,
-            player_hands=hand_request.playerHands,
-            action_sequence=hand_request.actionSequence,
-            winnings=winnings_str,
-            created_at=datetime.now().isoformat(),
+            player_hands=player_hands,
+            action_sequence=actions,
+            winnings=winnings_list,
+            created_at=created_at,
         )
 
-        saved_hand = hand_repository.save_hand(hand_record)
-
-        return {
-            "id": saved_hand.id,
-            "stackSize": saved_hand.stack_size,
-            "dealerPosition": saved_hand.dealer_position,
-            "smallBlindPosition": saved_hand.small_blind_position,
-            "bigBlindPosition": saved_hand.big_blind_position,
-            "playerHands": saved_hand.player_hands,
-            "actionSequence": saved_hand.action_sequence,
-            "winnings": saved_hand.winnings,
-            "createdAt": saved_hand.created_at,
-        }
+        await hand_writer.submit(hand_record)
+
+        # Returned directly so orjson encodes createdAt natively
+        return ORJSONResponse(hand_response(hand_request, hand_record))
     except Exception as e:
         logger.error(f"/api/hands POST error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def calculate_winnings_batch(hands):
+    # One call per chunk of (stack_size, player_hands, actions) tuples
+    return [calculate_winnings_with_pokerkit(*hand) for hand in hands]
+
+
+@app.post("/api/hands/bulk")
+async def create_hands(hand_requests: List[HandRequest]):
+    # Bounds the CPU work and transaction size of a single request
+    if len(hand_requests) > MAX_BULK_HANDS:
+        raise HTTPException(
+            status_code=413, detail=f"At most {MAX_BULK_HANDS} hands per request"
+        )
+    if not hand_requests:
+        return ORJSONResponse([])
+    try:
+        parsed = [
+            (
+                parse_player_hands(hand_request.playerHands),
+                parse_action_sequence(hand_request.actionSequence),
+            )
+            for hand_request in hand_requests
+        ]
+
+        winnings_inputs = [
+            (hand_request.stackSize, player_hands, actions)
+            for hand_request, (player_hands, actions) in zip(hand_requests, parsed)
+        ]
+        if winnings_executor is None:
+            winnings_lists = await asyncio.to_thread(
+                calculate_winnings_batch, winnings_inputs
+            )
+        else:
+            # pokerkit replay is CPU-bound, so spread it across processes in
+            # one chunk per worker; per-hand tasks cost more in IPC than work
+            chunk_size = -(-len(winnings_inputs) // WINNINGS_WORKERS)
+            loop = asyncio.get_running_loop()
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        winnings_executor,
+                        calculate_winnings_batch,
+                        winnings_inputs[i : i + chunk_size],
+                    )
+                    for i in range(0, len(winnings_inputs), chunk_size)
+                )
+            )
+            winnings_lists = [winnings for chunk in chunks for winnings in chunk]
+
+        created_at = datetime.now()
+        hand_records = [
+            HandRecord(
+                id=hand_request.id,
+                stack_size=hand_request.stackSize,
+                dealer_position=hand_request.dealerPosition,
+                small_blind_position=hand_request.smallBlindPosition,
+                big_blind_position=hand_request.bigBlindPosition,
+                player_hands=player_hands,
+                action_sequence=actions,
+                winnings=winnings_list,
+                created_at=created_at,
+            )
+            for hand_request, (player_hands, actions), winnings_list in zip(
+                hand_requests, parsed, winnings_lists
+            )
+        ]
+
+        # One multi-row insert for the whole batch
+        await asyncio.to_thread(hand_repository.save_hands, hand_records)
+
+        return ORJSONResponse(
+            [
+                hand_response(hand_request, hand_record)
+                for hand_request, hand_record in zip(hand_requests, hand_records)
+            ]
+        )
+    except Exception as e:
+        logger.error(f"/api/hands/bulk POST error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+
+    # Each worker process opens its own connection pool and hand writer.
+    # Exported so the spawned workers size their pools for the same count
+    os.environ.setdefault("WEB_CONCURRENCY", str(os.cpu_count() or 1))
+    # app_dir makes "app.main" importable when run as python app/main.py
+    uvicorn.run(
+        "app.main:app",
+        app_dir=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        host="0.0.0.0",
+        port=8000,
+        loop=loop,
+        http=http,
+        workers=int(os.environ["WEB_CONCURRENCY"]),
+    )
@@ -11,18 +11,19 @@ CREATE TABLE IF NOT EXISTS hands (
     dealer_position INTEGER NOT NULL,
     small_blind_position INTEGER NOT NULL,
     big_blind_position INTEGER NOT NULL,
-    player_hands TEXT NOT NULL,
-    action_sequence TEXT NOT NULL,
-    winnings TEXT NOT NULL,
+    player_hands JSONB NOT NULL,
+    action_sequence JSONB NOT NULL,
+    winnings JSONB NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Create index on created_at for faster queries
-CREATE INDEX IF NOT EXISTS idx_hands_created_at ON hands(created_at DESC);
+CREATE INDEX IF NOT EXISTS hands_created_at_desc_idx ON hands (created_at DESC)
+    INCLUDE (id, stack_size, dealer_position, small_blind_position, big_blind_position);
 
 -- Insert sample data
 INSERT INTO hands (id, stack_size, dealer_position, small_blind_position, big_blind_position, player_hands, action_sequence, winnings, created_at)
 VALUES 
-    ('39b5999a-cdc1-4469-947e-649d30aa6158', 10000, 2, 3, 4, 'Player 1: Tc2c; Player 2: 5d4c; Player 3: Ah4s; Player 4: QcTd', 'f.f.f.r300.c.f.3hKdQs.x.b100.c.Ac.x.x.Th.b80.r160.c', 'Player 1: -40; Player 2: 0; Player 3: -560; Player 4: +600', NOW()),
-    ('20136838-db93-4328-bfc7-dde223ef14d2', 10000, 2, 3, 4, 'Player 1: Tc2c; Player 2: 5d4c; Player 3: Ah4s; Player 4: QcTd', 'f.f.f.r300.c.f.3hKdQs.x.b100.c.Ac.x.x.Th.b80.r160.c', 'Player 1: -40; Player 2: 0; Player 3: -560; Player 4: +600', NOW())
+    ('39b5999a-cdc1-4469-947e-649d30aa6158', 10000, 2, 3, 4, '["Tc2c", "5d4c", "Ah4s", "QcTd"]', '["f", "f", "f", "r300", "c", "f", "3hKdQs", "x", "b100", "c", "Ac", "x", "x", "Th", "b80", "r160", "c"]', '[-40, 0, -560, 600]', NOW()),
+    ('20136838-db93-4328-bfc7-dde223ef14d2', 10000, 2, 3, 4, '["Tc2c", "5d4c", "Ah4s", "QcTd"]', '["f", "f", "f", "r300", "c", "f", "3hKdQs", "x", "b100", "c", "Ac", "x", "x", "Th", "b80", "r160", "c"]', '[-40, 0, -560, 600]', NOW())
 ON CONFLICT (id) DO NOTHING;
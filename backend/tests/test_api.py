@@ -1,6 +1,19 @@
 import pytest
 from fastapi.testclient import TestClient
-from app.main import app
+from app.main import (
+    MAX_BULK_HANDS,
+    HandWriter,
+    app,
+    encode_card,
+    json_array_chunks,
+    pack_hand,
+    parse_player_hands,
+    winnings_cache_key,
+)
+from concurrent.futures import ThreadPoolExecutor
+import app.main as main
+import asyncio
+import json
 import uuid
 
 client = TestClient(app)
@@ -33,3 +46,160 @@ def test_create_hand():
     result = response.json()
     assert result["id"] == hand_data["id"]
     assert result["stackSize"] == hand_data["stackSize"]
+
+def test_get_hands_not_modified():
+    response = client.get("/api/hands")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get("/api/hands", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+def test_create_hands_bulk():
+    hands_data = [
+        {
+            "id": str(uuid.uuid4()),
+            "stackSize": 10000,
+            "dealerPosition": 0,
+            "smallBlindPosition": 1,
+            "bigBlindPosition": 2,
+            "playerHands": "Player 1: AhKh; Player 2: QsQd; Player 3: 9c9d; Player 4: 8s8h; Player 5: 7c7d; Player 6: 6s6h",
+            "actionSequence": action_sequence,
+            "winnings": ""
+        }
+        for action_sequence in ["f.f.f.f.f", "f.f.f.r300.c.f"]
+    ]
+
+    response = client.post("/api/hands/bulk", json=hands_data)
+    assert response.status_code == 200
+
+    result = response.json()
+    assert [hand["id"] for hand in result] == [hand["id"] for hand in hands_data]
+    assert result[0]["winnings"] == [-20, 20, 0, 0, 0, 0]
+
+def test_create_hands_bulk_executor(monkeypatch):
+    monkeypatch.setattr(main, "WINNINGS_WORKERS", 2)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        monkeypatch.setattr(main, "winnings_executor", executor)
+
+        response = client.post("/api/hands/bulk", json=[])
+        assert response.status_code == 200
+        assert response.json() == []
+
+        hands_data = [
+            {
+                "id": str(uuid.uuid4()),
+                "stackSize": 10000,
+                "dealerPosition": 0,
+                "smallBlindPosition": 1,
+                "bigBlindPosition": 2,
+                "playerHands": "Player 1: AhKh; Player 2: QsQd; Player 3: 9c9d; Player 4: 8s8h; Player 5: 7c7d; Player 6: 6s6h",
+                "actionSequence": action_sequence,
+                "winnings": ""
+            }
+            for action_sequence in ["f.f.f.f.f", "f.f.f.r300.c.f", "f.f.f.f.f"]
+        ]
+
+        response = client.post("/api/hands/bulk", json=hands_data)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert [hand["id"] for hand in result] == [hand["id"] for hand in hands_data]
+        assert [hand["winnings"] for hand in result] == [
+            [-20, 20, 0, 0, 0, 0],
+            [-300, -40, 0, 0, 0, -300],
+            [-20, 20, 0, 0, 0, 0],
+        ]
+
+def test_parse_player_hands():
+    assert parse_player_hands("Player 1: AhKh; Player 2: QsQd;") == ["AhKh", "QsQd"]
+    assert parse_player_hands("Player 1: Ah Kh") == ["Ah Kh"]
+    with pytest.raises(ValueError):
+        parse_player_hands("AhKh; Player 2: QsQd")
+
+def test_json_array_chunks():
+    items = [{"id": i} for i in range(5)]
+    chunks = list(json_array_chunks(items, chunk_size=2))
+    assert len(chunks) == 3
+    assert json.loads(b"".join(chunks)) == items
+    assert b"".join(json_array_chunks([])) == b"[]"
+
+def test_create_hands_bulk_too_many():
+    hand_data = {
+        "id": str(uuid.uuid4()),
+        "stackSize": 10000,
+        "dealerPosition": 0,
+        "smallBlindPosition": 1,
+        "bigBlindPosition": 2,
+        "playerHands": "Player 1: AhKh",
+        "actionSequence": "",
+        "winnings": ""
+    }
+
+    response = client.post("/api/hands/bulk", json=[hand_data] * (MAX_BULK_HANDS + 1))
+    assert response.status_code == 413
+
+def test_pack_hand_bit_layout():
+    assert encode_card("2c") == 0
+    assert encode_card("Ah") == 50
+    assert pack_hand("AhKh") == 50 | 46 << 6
+
+def test_pack_hand_rejects_invalid_cards():
+    for cards in ["ahkh", "AhXh", "AhKz", "AhKhQs", "Ah", ""]:
+        with pytest.raises(ValueError):
+            pack_hand(cards)
+
+def test_winnings_cache_key_stable():
+    key = winnings_cache_key(10000, ["AhKh", "QsQd"], ["f", "cc"])
+    assert key.startswith("pk:")
+    assert key == winnings_cache_key(10000, ["AhKh", "QsQd"], ["f", "cc"])
+    assert key == winnings_cache_key(10000, ["Ah Kh", "QsQd"], ["f", "cc"])
+    assert key != winnings_cache_key(20000, ["AhKh", "QsQd"], ["f", "cc"])
+    assert key != winnings_cache_key(10000, ["QsQd", "AhKh"], ["f", "cc"])
+    assert key != winnings_cache_key(10000, ["AhKh", "QsQd"], ["f", "f"])
+
+class StubRepository:
+    def __init__(self):
+        self.calls = []
+
+    def save_hands(self, hands):
+        self.calls.append(list(hands))
+        if "bad" in hands:
+            raise ValueError("bad hand")
+
+    def save_hand(self, hand):
+        self.save_hands([hand])
+        return hand
+
+def test_hand_writer_batches_and_retries():
+    repository = StubRepository()
+    writer = HandWriter(repository)
+
+    async def run():
+        writer.start()
+        first = await asyncio.gather(
+            *(writer.submit(hand) for hand in ["a", "b", "bad"]),
+            return_exceptions=True,
+        )
+        second = await asyncio.gather(writer.submit("c"), writer.submit("d"))
+        # Hands still queued at shutdown are written before stop() returns
+        pending = [asyncio.create_task(writer.submit(hand)) for hand in ["e", "f"]]
+        await asyncio.sleep(0)
+        await writer.stop()
+        return first, second, await asyncio.gather(*pending)
+
+    first, second, pending = asyncio.run(run())
+    assert first[:2] == ["a", "b"]
+    assert isinstance(first[2], ValueError)
+    assert second == ["c", "d"]
+    assert pending == ["e", "f"]
+    assert repository.calls == [
+        ["a", "b", "bad"],
+        ["a"],
+        ["b"],
+        ["bad"],
+        ["c", "d"],
+        ["e", "f"],
+    ]
+    assert writer.task is None
@@ -324,9 +324,16 @@ export default function PokerApp() {
                           Stack {hand.stackSize}; Dealer: Player {hand.dealerPosition + 1}; Player{" "}
                           {hand.smallBlindPosition + 1} Small blind; Player {hand.bigBlindPosition + 1}
                         </div>
-                        <div>Hands: {hand.playerHands}</div>
-                        <div>Actions: {hand.actionSequence}</div>
-                        <div>Winnings: {hand.winnings}</div>
+                        <div>
+                          Hands: {hand.playerHands.map((cards, i) => `Player ${i + 1}: ${cards}`).join("; ")}
+                        </div>
+                        <div>Actions: {hand.actionSequence.join(".")}</div>
+                        <div>
+                          Winnings:{" "}
+                          {hand.winnings
+                            .map((change, i) => `Player ${i + 1}: ${change >= 0 ? "+" : ""}${change}`)
+                            .join("; ")}
+                        </div>
                       </div>
                     ))}
                   </div>
@@ -30,8 +30,8 @@ export interface HandHistory {
   dealerPosition: number
   smallBlindPosition: number
   bigBlindPosition: number
-  playerHands: string
-  actionSequence: string
-  winnings: string
+  playerHands: string[]
+  actionSequence: string[]
+  winnings: number[]
   createdAt: string
 }